@@ -7,11 +7,12 @@ It also is responsible to send the JSON commands to the CoreMiners stdin. To pas
 JSON feedback it uses the CommandParser and FeedbackParser class.  to handle communication and update the applications data store accordingly.
 """
 
+import os
 import time
 import subprocess
 import json
 import threading
-from queue import Queue
+from queue import Queue, SimpleQueue
 import atexit
 
 # Import parser logic
@@ -33,10 +34,12 @@ class CoreMinerProcess:
         command_finished (bool): Flag indicating whether the previous command has finished executing.
         command_parser (CommandParser): An instance used to parse text commands into JSON commands.
         feedback_parser (FeedbackParser): An instance used to process JSON feedback from the CoreMiner.
-        queue_feedback (Queue): Queue for storing JSON feedback messages.
-        queue_output (Queue): Queue for storing non-JSON stdout messages.
-        queue_stderr (Queue): Queue for storing stderr messages.
+        queue_feedback (SimpleQueue): Queue for storing JSON feedback messages.
+        queue_output (SimpleQueue): Queue for storing non-JSON stdout messages.
+        queue_stderr (SimpleQueue): Queue for storing stderr messages.
         queue_commands (Queue): Queue for storing JSON commands to send to the process.
+        _wakeup_r (int): Read end of the wakeup pipe that becomes readable whenever new data was queued.
+        _wakeup_w (int): Write end of the wakeup pipe used by the reader threads to signal new data.
     """
 
     def __init__(self, data_store):
@@ -44,7 +47,7 @@ class CoreMinerProcess:
         Initialize the CoreMinerProcess instance and launch the CoreMiner subprocess.
 
         The process is started with pipes for stdin, stdout, and stderr. The process is also registered
-        for termination upon program exit. Command and feedback parsers are initialized, and background threads
+        for termination upon program exit, together with closing the wakeup pipe. Command and feedback parsers are initialized, and background threads
         are started to handle asynchronous reading of the process's output and sending of commands.
 
         Args:
@@ -58,18 +61,24 @@ class CoreMinerProcess:
             text=True
         )
 
-        atexit.register(lambda: self.process.terminate())
-
         self.data_store = data_store
         self.command_finished = True
 
         self.command_parser = CommandParser()
         self.feedback_parser = FeedbackParser(self.data_store)
 
-        self.queue_feedback = Queue()
-        self.queue_output = Queue()
-        self.queue_stderr = Queue()
+        self.queue_feedback = SimpleQueue()
+        self.queue_output = SimpleQueue()
+        self.queue_stderr = SimpleQueue()
         self.queue_commands = Queue()
+
+        # Self-pipe used to wake up the TUI event loop when new data has been queued
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(self._wakeup_w, False)
+
+        atexit.register(self._shutdown)
+
         threading.Thread(target=self._read_stdout, daemon=True).start()
         threading.Thread(target=self._read_stderr, daemon=True).start()
         threading.Thread(target=self._send_command, daemon=True).start()
@@ -78,39 +87,44 @@ class CoreMinerProcess:
         """
         Continuously read lines from the CoreMiner process's stdout.
 
+        The thread reads as fast as the pipe delivers lines and stops once the process closes its stdout.
         Each line read is stripped of whitespace and then attempted to be parsed as JSON. If successful,
         line read is a feedback from the CoreMiner and is added to the feedback queue; otherwise, the line 
         is interpreted as output from the debuggee and added to the output queue.
         """
         while True:
-            time.sleep(0.01)
-            if self.process.stdout:
-                line_stdout = self.process.stdout.readline().strip()
-                if line_stdout:
-                    try:
-                        # Try to parse as JSON
-                        self.queue_feedback.put(json.loads(line_stdout))
-                    except Exception as e:
-                        self.queue_output.put(str(line_stdout))
+            # readline blocks until a line is available, so no sleep is needed between reads
+            line = self.process.stdout.readline()
+            if not line:  # EOF, the CoreMiner process has exited
+                return
+            line_stdout = line.strip()
+            if line_stdout:
+                try:
+                    # Try to parse as JSON
+                    self._enqueue(self.queue_feedback, json.loads(line_stdout))
+                except Exception as e:
+                    self._enqueue(self.queue_output, str(line_stdout))
 
     def _read_stderr(self):
         """
         Continuously read lines from the CoreMiner process's stderr.
 
+        The thread reads as fast as the pipe delivers lines and stops once the process closes its stderr.
         Each line read is stripped of whitespace and then attempted to be parsed as JSON. If JSON parsing fails,
         the raw string is added to the stderr queue.
         """
         while True:
-            time.sleep(0.01)
-            if self.process.stderr:
-                line_stderr = self.process.stderr.readline().strip()
-                if line_stderr:
-                    try:
-                        # Try to parse as JSON
-                        self.queue_stderr.put(json.loads(line_stderr))
-                    except json.JSONDecodeError:
-                        # If not JSON, store as a regular string
-                        self.queue_stderr.put(line_stderr)
+            line = self.process.stderr.readline()
+            if not line:  # EOF, the CoreMiner process has exited
+                return
+            line_stderr = line.strip()
+            if line_stderr:
+                try:
+                    # Try to parse as JSON
+                    self._enqueue(self.queue_stderr, json.loads(line_stderr))
+                except json.JSONDecodeError:
+                    # If not JSON, store as a regular string
+                    self._enqueue(self.queue_stderr, line_stderr)
 
     def parse_command(self, command: str):
         """
@@ -129,7 +143,7 @@ class CoreMinerProcess:
         if result_dict:
             # If the parser returned a dict, check for an error and return feedback if present.
             if "feedback" in result_dict:
-                self.queue_feedback.put(result_dict)
+                self._enqueue(self.queue_feedback, result_dict)
             else:
                 # Otherwise, send the valid JSON command to the Rust process.
                 self.queue_commands.put((json.dumps(result_dict)))
@@ -153,14 +167,86 @@ class CoreMinerProcess:
                     self.command_finished = False
                     self.data_store.set_responses_coreminer(command)
 
-    def get_response(self):
+    def fileno(self) -> int:
+        """
+        Return the read end of the wakeup pipe.
+
+        The file descriptor becomes readable whenever a reader thread queued new data, so it can be
+        registered with an event loop instead of polling the queues in a fixed interval.
+
+        Returns:
+            int: The file descriptor of the wakeup pipe's read end.
+        """
+        return self._wakeup_r
+
+    def _enqueue(self, queue: SimpleQueue, item) -> None:
+        """
+        Put an item into one of the incoming queues and wake up the event loop.
+
+        The TUI only processes the incoming queues when the wakeup pipe becomes readable, so every
+        producer of the feedback, output and stderr queues must use this method instead of calling put directly.
+
+        Args:
+            queue (SimpleQueue): The incoming queue the item belongs to.
+            item: The feedback dict or output line to queue.
+        """
+        queue.put(item)
+        self._notify()
+
+    def _notify(self) -> None:
+        """
+        Signal the event loop that new data has been queued by writing a byte into the wakeup pipe.
+
+        If the pipe is full, the event loop already has a pending wakeup, so the byte can be dropped.
+        If the pipe has already been closed during shutdown, there is nobody left to wake up.
+        """
+        try:
+            os.write(self._wakeup_w, b"\0")
+        except OSError:
+            pass
+
+    def _shutdown(self) -> None:
+        """
+        Terminate the CoreMiner process and close the wakeup pipe on program exit.
+        """
+        self.process.terminate()
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
+
+    def clear_wakeup(self) -> None:
+        """
+        Read all pending bytes from the wakeup pipe without blocking.
+
+        Must be called when handling a wakeup, otherwise the file descriptor stays readable.
+        """
+        try:
+            while os.read(self._wakeup_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def has_pending(self) -> bool:
+        """
+        Check whether any output, stderr or feedback message is waiting to be processed.
+
+        Returns:
+            bool: True if at least one of the incoming queues is not empty, False otherwise.
+        """
+        return not (
+            self.queue_output.empty()
+            and self.queue_stderr.empty()
+            and self.queue_feedback.empty()
+        )
+
+    def get_response(self) -> bool:
         """
         Retrieve and process responses from the CoreMiner process.
 
         This method checks for JSON feedback in the feedback queue and processes it using the FeedbackParser,
         which updates the data store. If a command executes successfully, the command_finished flag is set.
-        Additionally, if there is non-JSON output in the output queue, it updates the debuggee output in the data store.
-        The method returns True when a complete response has been processed and the command queue is empty to trigger
+        Additionally, if there is non-JSON output in the output or stderr queue, it updates the debuggee output in the data store.
+        Only one message is processed per call, so the caller decides how many messages it handles at once.
+        The method returns True when output has been stored or a complete response has been processed and the command queue is empty to trigger
         the TUI to reload the information of each widget. Due to performance issues we only update the widgets when
         the comamnd queue is empty insetad of after every command.
 
@@ -168,17 +254,15 @@ class CoreMinerProcess:
             bool: True if a response (feedback or output) was processed and the command is finished, False otherwise.
         """
         # Check for non-JSON output from the debuggee
-        while not self.queue_output.empty():
+        if not self.queue_output.empty():
             output = self.queue_output.get()
             self.data_store.set_output("[d]: " + output)
-            if self.queue_output.empty():
-                return True
-            
-        while not self.queue_stderr.empty():
+            return True
+
+        if not self.queue_stderr.empty():
             output = self.queue_stderr.get()
             self.data_store.set_output("[d][!]: " + output)
-            if self.queue_stderr.empty():
-                return True
+            return True
 
         if not self.queue_feedback.empty():
             feedback = self.queue_feedback.get()
@@ -9,52 +9,115 @@ class DataStore:
     components can query and update this shared data store to reflect the current state of the debuggee.
     """
 
-    def __init__(self):
+    __slots__ = (
+        "_responses_coreminer",
+        "registers",
+        "stack",
+        "rip",
+        "_output",
+        "disassembly",
+        "backtrace",
+        "_versions",
+        "_fmt_cache",
+    )
+
+    def __init__(self) -> None:
         """
         Initialize the DataStore with default empty values.
 
         Attributes:
-            responses_coreminer (Optional[str]): Stores concatenated responses from CoreMiner. Initialized as None.
+            _responses_coreminer (list[str]): Stores the responses from CoreMiner, joined when they are read.
             registers (str): Stores the current register values as a string.
             stack (str): Stores the current stack as a string.
             rip (str): Stores the current instruction pointer (RIP) as a string.
-            output (str): Stores debuggee output messages.
+            _output (list[str]): Stores debuggee output messages, joined when they are read.
             disassembly (str): Stores disassembly information.
+            backtrace (str): Stores the current backtrace as a string.
+            _versions (dict[str, int]): Counts the mutations of each field, so widgets can skip redundant updates.
+            _fmt_cache (dict[str, tuple[int, str]]): Caches the joined messages together with the version they were built for.
         """
-        self.responses_coreminer: Optional[str] = None
+        self._responses_coreminer: list[str] = []
         self.registers = ""
         self.stack = ""
         self.rip = ""
-        self.output = ""
+        self._output: list[str] = []
         self.disassembly = ""
         self.backtrace = ""
+        self._versions: dict[str, int] = {
+            "responses_coreminer": 0,
+            "registers": 0,
+            "stack": 0,
+            "rip": 0,
+            "output": 0,
+            "disassembly": 0,
+            "backtrace": 0,
+        }
+        self._fmt_cache: dict[str, tuple[int, str]] = {}
+
+    def get_version(self, field: str) -> int:
+        """
+        Return the version of a stored field.
+
+        The version is incremented on every mutation of the field, so a widget only needs to
+        re-render when the version differs from the one it has last seen.
+
+        Args:
+            field (str): The name of the field, e.g. "output" or "registers".
+
+        Returns:
+            int: The current version of the field.
+        """
+        return self._versions[field]
+
+    def _join(self, field: str, messages: list[str]) -> str:
+        """
+        Join the stored messages of a field into one string, separated by new lines.
+
+        The result is cached for the current version of the field, so the messages are only joined
+        once after each mutation instead of every time a widget reads them.
+
+        Args:
+            field (str): The name of the field, used as key for the version and the cache.
+            messages (list[str]): The stored messages of the field.
+
+        Returns:
+            str: The joined messages.
+        """
+        version = self._versions[field]
+        cached = self._fmt_cache.get(field)
+        if cached and cached[0] == version:
+            return cached[1]
+        joined = "\n".join(messages)
+        self._fmt_cache[field] = (version, joined)
+        return joined
 
     def set_responses_coreminer(self, response: str) -> None:
         """
         Append a new response from CoreMiner to the stored responses.
 
-        If responses already exist, the new response is appended on a new line.
-        Otherwise, the response is set as the initial value.
+        The responses are displayed on separate lines when they are read.
 
         Args:
             response (str): The response string from CoreMiner to be added.
         """
-        if self.responses_coreminer:
-            self.responses_coreminer += f"\n{response}"
-        else:
-            self.responses_coreminer = response
+        self._responses_coreminer.append(response)
+        self._versions["responses_coreminer"] += 1
 
-    def get_responses_coreminer(self) -> str:
-        return self.responses_coreminer
+    def get_responses_coreminer(self) -> Optional[str]:
+        if not self._responses_coreminer:
+            return None
+        return self._join("responses_coreminer", self._responses_coreminer)
     
     def set_registers(self, response: str) -> None:
         self.registers = response
+        self._versions["registers"] += 1
 
     def get_registers(self) -> str:
         return self.registers
     
     def set_stack(self, response: str) -> None:
         self.stack = response
+        self._versions["stack"] += 1
 
     def get_stack(self) -> str:
         return self.stack
@@ -63,34 +126,54 @@ class DataStore:
         """
         Append a new output message to the stored debuggee output.
 
-        If output already exists, the new message is appended on a new line.
-        Otherwise, the response is set as the initial output.
+        The messages are displayed on separate lines when they are read.
 
         Args:
             response (str): The output message to be added.
         """
-        if self.output:
-            self.output += f"\n{response}"
-        else:
-            self.output = response
+        self._output.append(response)
+        self._versions["output"] += 1
+
+    def get_output_count(self) -> int:
+        return len(self._output)
+
+    def get_output_since(self, index: int) -> str:
+        """
+        Return the output messages that have been added after the given message index.
+
+        Widgets that append output incrementally keep track of how many messages they have already shown
+        and only fetch the new ones, without joining the whole output again. If messages have been read
+        before, the result starts with a new line, so appending it continues the previously read text.
+
+        Args:
+            index (int): The number of output messages that have already been read.
+
+        Returns:
+            str: The messages after the index, an empty string if nothing new was added.
+        """
+        new_messages = self._output[index:]
+        if not new_messages:
+            return ""
+        joined = "\n".join(new_messages)
+        return f"\n{joined}" if index > 0 else joined
 
-    def get_output(self) -> str:
-        return self.output
-    
     def set_disassembly(self, response: str) -> None:
         self.disassembly = response
+        self._versions["disassembly"] += 1
     
     def get_disassembly(self) -> str:
         return self.disassembly
     
     def set_rip(self, response: str) -> None:
         self.rip = response
+        self._versions["rip"] += 1
 
     def get_rip(self) -> str:
         return self.rip
     
     def set_backtrace(self, response: str) -> None:
         self.backtrace = response
+        self._versions["backtrace"] += 1
 
     def get_backtrace(self) -> str:
         return self.backtrace
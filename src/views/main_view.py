@@ -7,8 +7,14 @@ Users can add or remove tabs that host various widgets, enter debugger commands,
 live updates from the debuggee.
 """
 
+import asyncio
+from collections import deque
+from functools import partial
+from typing import Callable
+
 from textual.screen import Screen
 from textual.app import ComposeResult
+from textual.widget import Widget
 from textual.events import Key
 from textual.containers import ScrollableContainer, VerticalScroll
 from textual.widgets import (
@@ -37,7 +43,17 @@ from widgets.stack import Stack
 from widgets.output import Output
 from widgets.disassembly import Disassembly
 from widgets.backtrace import Backtrace
-
+from widgets.change_tracker import ChangeTracker
+
+# Maps the widget names offered by the WidgetSelector to their classes
+_WIDGET_REGISTRY: dict[str, Callable[[DataStore], ChangeTracker]] = {
+    "RawResponses": RawResponses,
+    "Registers": Registers,
+    "Stack": Stack,
+    "Output": Output,
+    "Disassembly": Disassembly,
+    "Backtrace": Backtrace,
+}
 
 class MainView(Screen):
     """
@@ -49,6 +65,17 @@ class MainView(Screen):
     """
     CSS_PATH = "../css/main_view.tcss"
 
+    # Maximum number of CoreMiner messages processed per wakeup before yielding to the event loop
+    _MAX_RESPONSES_PER_WAKEUP = 200
+
+    # (tabbed_content_id, plus_tab_id, css_class, add_button_id) for every window
+    _PANELS = (
+        ("main_tabs",    "add_main",    "main_window",   "add_main_tabs"),
+        ("small_tabs_1", "add_small_1", "small_window",  "add_small_tabs_1"),
+        ("small_tabs_2", "add_small_2", "small_window",  "add_small_tabs_2"),
+        ("medium_tabs",  "add_medium",  "medium_window", "add_medium_tabs"),
+    )
+
     def __init__(self) -> None:
         """
         Initialize the MainView.
@@ -57,26 +84,41 @@ class MainView(Screen):
         and creates the central data store.
         """
         super().__init__()
-        # Keep your tab counters and add_tab_map from earlier
-        self.tab_counters = {
-            "main_tabs": 0,
-            "small_tabs_1": 0,
-            "small_tabs_2": 0,
-            "medium_tabs": 0,
-        }
-        self.add_tab_map = {
-            "main_tabs":    "add_main",
-            "small_tabs_1": "add_small_1",
-            "small_tabs_2": "add_small_2",
-            "medium_tabs":  "add_medium",
-        }
+        # Tab counters and the "[+]" tab of each tabbed content, derived from _PANELS
+        self.tab_counters = {tc_id: 0 for tc_id, _, _, _ in self._PANELS}
+        self.add_tab_map = {tc_id: plus_id for tc_id, plus_id, _, _ in self._PANELS}
 
-        # Command history storage
-        self.command_history: list[str] = []
+        # Command history storage, bounded so long sessions do not grow it indefinitely
+        self.command_history: deque[str] = deque(maxlen=1000)
         self.history_index: int = 0  # Will track which command in history is displayed
 
         self.data_store = DataStore()
 
+        # Widgets providing an update_content() method, kept in sync by add_tab / delete_tab
+        self._updatables: list[ChangeTracker] = []
+        self._tab_to_widget: dict[str, ChangeTracker] = {}
+
+        # TabbedContent widgets by their ID, cached on mount
+        self._tabbed: dict[str, TabbedContent] = {}
+
+        # Updatable widget of the active tab for each tabbed content, only these are updated
+        self._active_updatables: dict[str, ChangeTracker] = {}
+
+        # Maps each delete button ID to its (tabbed_content_id, tab_id), filled by add_tab
+        self._delete_button_map: dict[str, tuple[str, str]] = {}
+
+        # Maps button IDs to the action they trigger, delete buttons are added by add_tab
+        self._button_handlers: dict[str, Callable[[], None]] = {
+            button_id: partial(self._open_widget_selector, tc_id)
+            for tc_id, _, _, button_id in self._PANELS
+        }
+
+        # Set while a debounced widget update is scheduled but not yet flushed
+        self._update_pending: bool = False
+
+        # Set while the WidgetSelector modal covers the screen, responses are only stored meanwhile
+        self._updates_paused: bool = False
+
     def compose(self) -> ComposeResult:
         """
         Creates UI layout including an interactive command line at the bottom.
@@ -86,25 +128,11 @@ class MainView(Screen):
         """
         yield Header()
 
-        # Main window
-        with TabbedContent(initial="add_main", id="main_tabs", classes="box main_window"):
-            with TabPane("\\[+]", id="add_main"):
-                yield Button("Add Tab", id="add_main_tabs")
-
-        # Small window #1
-        with TabbedContent(initial="add_small_1", id="small_tabs_1", classes="box small_window"):
-            with TabPane("\\[+]", id="add_small_1"):
-                yield Button("Add Tab", id="add_small_tabs_1")
-
-        # Small window #2
-        with TabbedContent(initial="add_small_2", id="small_tabs_2", classes="box small_window"):
-            with TabPane("\\[+]", id="add_small_2"):
-                yield Button("Add Tab", id="add_small_tabs_2")
-
-        # Medium window
-        with TabbedContent(initial="add_medium", id="medium_tabs", classes="box medium_window"):
-            with TabPane("\\[+]", id="add_medium"):
-                yield Button("Add Tab", id="add_medium_tabs")
+        # Main window, two small windows and the medium window
+        for tc_id, plus_id, css_class, button_id in self._PANELS:
+            with TabbedContent(initial=plus_id, id=tc_id, classes=f"box {css_class}"):
+                with TabPane("\\[+]", id=plus_id):
+                    yield Button("Add Tab", id=button_id)
 
         # Command Line Input
         yield Input(
@@ -118,49 +146,133 @@ class MainView(Screen):
     # ─────────────────────────────────────────────────────────────────────────
     # EVENT HANDLERS
     # ─────────────────────────────────────────────────────────────────────────
-    def on_mount(self):
+    def on_mount(self) -> None:
         """
         Initialize CoreMiner process when the MainView is mounted.
 
-        Starts the CoreMiner process with the central data store and sets up a recurring interval
-        to poll for responses from CoreMiner.
+        Starts the CoreMiner process with the central data store, caches the command input and tabbed contents,
+        and registers the wakeup file descriptor of CoreMiner with the event loop, so responses are handled
+        as soon as they arrive instead of being polled.
         """
         self.process = CoreMinerProcess(self.data_store)
-        self.set_interval(0.1, self.check_coreminer_output)
+        self._command_input = self.query_one("#command_input", Input)
+        self._tabbed = {
+            tabbed_content_id: self.query_one(f"#{tabbed_content_id}", TabbedContent)
+            for tabbed_content_id in self.add_tab_map
+        }
+        asyncio.get_running_loop().add_reader(self.process.fileno(), self._on_coreminer_readable)
+
+    def on_unmount(self) -> None:
+        """
+        Stop watching the CoreMiner wakeup file descriptor when the MainView is unmounted.
+        """
+        asyncio.get_running_loop().remove_reader(self.process.fileno())
+
+    def _on_coreminer_readable(self) -> None:
+        """
+        Called by the event loop when the CoreMiner process has queued new data.
+
+        Clears the wakeup signal and processes everything that has been queued so far.
+        """
+        self.process.clear_wakeup()
+        self.check_coreminer_output()
+
+    def check_coreminer_output(self) -> None:
+        """
+        Processes the pending responses from CoreMiner.
+
+        Up to _MAX_RESPONSES_PER_WAKEUP responses are processed at once. If more are left, another run is
+        scheduled, so a debuggee printing in a tight loop cannot block the event loop. If at least one of
+        the responses requires the TUI to be refreshed, a single debounced widget update is scheduled
+        instead of updating once per response.
+        While updates are paused the responses are still stored in the data store, but no update is scheduled.
+        """
+        batched: bool = False
+        for _ in range(self._MAX_RESPONSES_PER_WAKEUP):
+            if not self.process.has_pending():
+                break
+            if self.process.get_response():
+                batched = True
+        else:
+            if self.process.has_pending():
+                self.call_later(self.check_coreminer_output)
+
+        if self._updates_paused:
+            return
 
-    def check_coreminer_output(self):
+        if batched and not self._update_pending:
+            self._update_pending = True
+            self.set_timer(0.05, self._flush_updates)
+
+    def _flush_updates(self) -> None:
         """
-        Polls CoreMiner for responses.
+        Perform the scheduled widget update.
 
-        If a response is available, the method triggers an update of all widgets.
+        Resets the pending flag and updates all widgets inside a batch update, so the screen is only
+        repainted once after every widget got its new content.
         """
-        response = self.process.get_response()
-        if response:
+        self._update_pending = False
+        if self._updates_paused:
+            return
+        with self.app.batch_update():
             self.update_all_widgets()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """
         Handle '[+] Add Tab' buttons and any 'delete_*' buttons.
 
-        For an "add_" button, open the WidgetSelector modal.
-        For a "delete_" button, delete the corresponding tab.
+        The handler registered for the button's ID is looked up and called.
+        For an "add_" button, the WidgetSelector modal is opened.
+        For a "delete_" button, the corresponding tab is deleted.
 
         Args:
             event (Button.Pressed): The button press event containing the button's ID.
         """
         button_id = event.button.id
+        if button_id is None:
+            return
 
-        # If it's an "add_" button, open the WidgetSelector modal
-        if button_id.startswith("add_"):
-            # e.g. "add_main_tabs" -> tabbed_content_id = "main_tabs"
-            tabbed_content_id = button_id.replace("add_", "")
-            self.app.push_screen(
-                WidgetSelector(),
-                callback=lambda choice: self._on_widget_choice(choice, tabbed_content_id)
-            )
+        handler = self._button_handlers.get(button_id)
+        if handler is not None:
+            handler()
 
-        elif button_id.startswith("delete_"):
-            self.delete_tab(button_id)
+    def _open_widget_selector(self, tabbed_content_id: str) -> None:
+        """
+        Pause the widget updates and open the WidgetSelector modal for a tabbed content area.
+
+        Args:
+            tabbed_content_id (str): The ID of the tabbed content area the selected widget is added to.
+        """
+        self._updates_paused = True
+        self.app.push_screen(
+            WidgetSelector(),
+            callback=lambda choice: self._on_widget_choice(choice, tabbed_content_id)
+        )
+
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """
+        Track the widget of the newly activated tab and refresh it.
+
+        Widgets in inactive tabs are not updated, so the content is brought up to date when the tab is shown.
+
+        Args:
+            event (TabbedContent.TabActivated): The event containing the tabbed content and the activated pane.
+        """
+        tabbed_content_id = event.tabbed_content.id
+        pane_id = event.pane.id
+        if tabbed_content_id is None or pane_id is None:
+            return
+
+        widget = self._tab_to_widget.get(pane_id)
+
+        if widget is not None:
+            self._active_updatables[tabbed_content_id] = widget
+            # add_tab activates a new tab before its pane is mounted, the first content of
+            # such a widget is rendered by its own on_mount instead
+            if widget.is_mounted:
+                widget.update_content()
+        else:
+            self._active_updatables.pop(tabbed_content_id, None)
 
     def on_key(self, event: Key) -> None:
         """
@@ -171,8 +283,11 @@ class MainView(Screen):
         Args:
             event (Key): The key event.
         """
+        if event.key not in ("up", "down"):
+            return
+
         # We'll only do this if the command_input is focused
-        command_input = self.query_one("#command_input", Input)
+        command_input = self._command_input
         if not command_input.has_focus:
             return
 
@@ -215,10 +330,13 @@ class MainView(Screen):
         """
         Append Command to history and send it to the CoreMiner process.
 
+        A command is not added to the history again if it equals the previous one.
+
         Args:
             command (str): The command string entered by the user.
         """
-        self.command_history.append(command)
+        if not self.command_history or self.command_history[-1] != command:
+            self.command_history.append(command)
         self.process.parse_command(command)
         
     # ─────────────────────────────────────────────────────────────────────────
@@ -228,12 +346,16 @@ class MainView(Screen):
         """
         Called when the user closes the WidgetSelector modal.
 
+        Resumes the widget updates that were paused while the modal was open and performs one update pass.
         If a valid widget is selected, add a new tab with the widget to the specified tabbed content area.
 
         Args:
             choice (str | None): The selected widget name or None if no selection was made.
             tabbed_content_id (str): The ID of the tabbed content area where the widget should be added.
         """
+        self._updates_paused = False
+        self._flush_updates()
+
         if choice is not None:
             self.add_tab(tabbed_content_id, choice)
 
@@ -252,7 +374,7 @@ class MainView(Screen):
             print(f"No such tabbed content: {tabbed_content_id}")
             return
 
-        tabbed_content = self.query_one(f"#{tabbed_content_id}", TabbedContent)
+        tabbed_content = self._tabbed[tabbed_content_id]
 
         # Increment counter for naming/ID
         self.tab_counters[tabbed_content_id] += 1
@@ -260,11 +382,19 @@ class MainView(Screen):
         new_tab_id = f"{tabbed_content_id}_tab_{counter_value}"
         new_tab_name = f"{widget_name}"
 
-        # Build the chosen widget
-        widget = self._create_widget(widget_name)
+        # Build the chosen widget, only widgets from the registry receive updates
+        updatable = self._create_widget(widget_name)
+        if updatable is None:
+            widget: Widget = Static(f"Unknown widget: {widget_name}")
+        else:
+            self._tab_to_widget[new_tab_id] = updatable
+            self._updatables.append(updatable)
+            widget = updatable
 
         # Container with the widget + a delete button
         delete_button_id = f"delete_{tabbed_content_id}_{new_tab_id}"
+        self._delete_button_map[delete_button_id] = (tabbed_content_id, new_tab_id)
+        self._button_handlers[delete_button_id] = partial(self.delete_tab, delete_button_id)
         content_container = ScrollableContainer(
             VerticalScroll(
                 widget
@@ -285,19 +415,13 @@ class MainView(Screen):
         Remove a tab, given the button ID "delete_{tabbed_content_id}_{tab_id}".
         E.g.: "delete_main_tabs_main_tabs_tab_3"
 
+        The tabbed content and tab belonging to the button are looked up in the mapping filled by add_tab.
+
         Args:
             delete_button_id (str): The identifier of the delete button triggering the tab removal.
         """
-        remainder = delete_button_id.removeprefix("delete_")
-
-        tabbed_content_id = None
-        tab_id = None
-        for candidate_id in self.add_tab_map:
-            prefix = candidate_id + "_"
-            if remainder.startswith(prefix):
-                tabbed_content_id = candidate_id
-                tab_id = remainder[len(prefix):]
-                break
+        tabbed_content_id, tab_id = self._delete_button_map.pop(delete_button_id, (None, None))
+        self._button_handlers.pop(delete_button_id, None)
 
         if not tabbed_content_id or not tab_id:
             return
@@ -306,14 +430,21 @@ class MainView(Screen):
         if tab_id == self.add_tab_map[tabbed_content_id]:
             return
 
+        # Unregister the widget so it no longer receives updates
+        widget = self._tab_to_widget.pop(tab_id, None)
+        if widget is not None:
+            self._updatables.remove(widget)
+            if self._active_updatables.get(tabbed_content_id) is widget:
+                del self._active_updatables[tabbed_content_id]
+
         # Remove the pane
-        tabbed_content = self.query_one(f"#{tabbed_content_id}", TabbedContent)
+        tabbed_content = self._tabbed[tabbed_content_id]
         tabbed_content.remove_pane(tab_id)
 
     # ─────────────────────────────────────────────────────────────────────────
     # FACTORY FOR WIDGETS & Udaten the Content
     # ─────────────────────────────────────────────────────────────────────────
-    def _create_widget(self, widget_name: str):
+    def _create_widget(self, widget_name: str) -> ChangeTracker | None:
         """
         Return an instance of the selected widget by name.
 
@@ -321,42 +452,21 @@ class MainView(Screen):
             widget_name (str): The name of the widget to create.
 
         Returns:
-            Widget: The widget instance corresponding to the provided name,
-                    or a Static widget with an error message if unknown.
-        """
-        if widget_name == "RawResponses":
-            return RawResponses(self.data_store)
-        elif widget_name == "Registers":
-            return Registers(self.data_store)
-        elif widget_name == "Stack":
-            return Stack(self.data_store)
-        elif widget_name == "Output":
-            return Output(self.data_store)
-        elif widget_name == "Disassembly":
-            return Disassembly(self.data_store)
-        elif widget_name == "Backtrace":
-            return Backtrace(self.data_store)
-        else:
-            return Static(f"Unknown widget: {widget_name}")
+            ChangeTracker | None: The widget instance corresponding to the provided name,
+                                  or None if the name is not in the widget registry.
+        """
+        widget_class = _WIDGET_REGISTRY.get(widget_name)
+        if widget_class is None:
+            return None
+        return widget_class(self.data_store)
 
     def update_all_widgets(self) -> None:
         """
-        Use queries to locate every TabPane (besides the '[+]' tab), then
-        find any child widget with an 'update_content()' method and call it.
-        """
-        for tabbed_content_id, plus_tab_id in self.add_tab_map.items():
-            # Get the TabbedContent by its ID
-            tabbed_content = self.query_one(f"#{tabbed_content_id}", expect_type=TabbedContent)
-
-            # Query for all TabPane children in this TabbedContent
-            panes = tabbed_content.query("TabPane")
+        Call 'update_content()' on the widget of the active tab in every tabbed content.
 
-            for pane in panes:
-                # Skip the '[+]' tab by comparing pane.id to plus_tab_id
-                if pane.id == plus_tab_id:
-                    continue
-
-                # Inside this tab, find any widget with an update_content() method
-                for child in pane.query():
-                    if hasattr(child, "update_content") and callable(child.update_content):
-                        child.update_content()
+        Widgets in inactive tabs are refreshed once their tab gets activated. Widgets whose tab
+        has not finished mounting yet are skipped, they load their content in on_mount.
+        """
+        for widget in self._active_updatables.values():
+            if widget.is_mounted:
+                widget.update_content()
@@ -1,6 +1,8 @@
 from textual.widgets import Static
 
-class Backtrace(Static):
+from widgets.change_tracker import ChangeTracker
+
+class Backtrace(ChangeTracker, Static):
     """
     A widget that displays the backtrace of the debuggee.
     """
@@ -31,4 +33,6 @@ class Backtrace(Static):
         This method retrieves backtrace data from the data store using the `get_backtrace` method
         and updates the widget's display with this information.
         """
+        if not self._take_if_changed("backtrace"):
+            return
         self.update(self.data_store.get_backtrace())
@@ -0,0 +1,47 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from textual.widget import Widget
+    from data_store import DataStore
+
+    # The mixin is always combined with a Textual widget, this lets type checkers know about it
+    _WidgetBase = Widget
+else:
+    _WidgetBase = object
+
+class ChangeTracker(_WidgetBase):
+    """
+    Mixin for widgets that display a field of the data store.
+
+    Every widget in the MainView's widget registry (Output, Registers, Stack, Disassembly, Backtrace and
+    RawResponses) uses this mixin, which allows the MainView to call `update_content` without inspecting
+    each widget. It also remembers the version of the field the widget has shown last, so `update_content`
+    can skip re-rendering when the data has not changed since the previous update.
+    """
+
+    data_store: "DataStore"
+    _seen_version = -1
+
+    def update_content(self) -> None:
+        """
+        Update the widget's content with the latest data from the data store.
+        """
+        raise NotImplementedError
+
+    def _take_if_changed(self, field: str) -> bool:
+        """
+        Check whether the widget has to show a newer version of a data store field.
+
+        The current version is marked as seen when True is returned.
+
+        Args:
+            field (str): The name of the data store field the widget displays.
+
+        Returns:
+            bool: True if the widget has to update its content, False otherwise.
+        """
+        version = self.data_store.get_version(field)
+        if version == self._seen_version:
+            return False
+        self._seen_version = version
+        return True
@@ -1,6 +1,8 @@
 from textual.widgets import Static
 
-class Disassembly(Static):
+from widgets.change_tracker import ChangeTracker
+
+class Disassembly(ChangeTracker, Static):
     """
     A widget that displays disassembly output from CoreMiner.
 
@@ -35,4 +37,6 @@ class Disassembly(Static):
         This method retrieves disassembly data from the data store using `get_disassembly` and updates the
         widget's display accordingly.
         """
+        if not self._take_if_changed("disassembly"):
+            return
         self.update(self.data_store.get_disassembly())
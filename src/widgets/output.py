@@ -1,12 +1,16 @@
-from textual.widgets import Static
+from textual.widgets import Log
 
-class Output(Static):
+from widgets.change_tracker import ChangeTracker
+
+class Output(ChangeTracker, Log):
     """
     A widget for displaying general responses from CoreMiner that do not have a specific widget.
 
     This widget retrieves the output from a provided data store and displays it.
-    Markup rendering is disabled to ensure that raw text output is shown.
-    After updating the content, the widget's parent container is scrolled to the bottom to allways show the newest entry.
+    The Log widget renders plain text, so the raw output is shown without parsing any markup.
+    Only the output added since the last update is appended, instead of re-rendering the whole text.
+    After appending new output, the log is scrolled to the bottom to allways show the newest entry,
+    unless the user has scrolled up.
     """
     
     def __init__(self, data_store):
@@ -14,11 +18,12 @@ class Output(Static):
         Initialize the Output widget.
 
         Args:
-            data_store: An object that provides debuggee output data through the `get_output` method.
+            data_store: An object that provides debuggee output data through the `get_output_since` and
+                        `get_output_count` methods.
         """
         super().__init__()
         self.data_store = data_store
-        self._render_markup = False
+        self._output_index = 0
         
     def on_mount(self):
         """
@@ -30,10 +35,20 @@ class Output(Static):
 
     def update_content(self):
         """
-        Update the widget's content and scroll to the bottom.
+        Append the new output and scroll to the bottom.
 
-        This method retrieves the latest output from the data store using `get_output`,
-        updates the display with this output, and scrolls the parent container to the bottom without animation.
+        This method retrieves the output added since the last update from the data store using `get_output_since`,
+        appends it to the log, and scrolls the log to the bottom if it was already scrolled to the bottom before.
         """
-        self.update(self.data_store.get_output())
-        self.parent.scroll_end(animate=False)
+        if not self._take_if_changed("output"):
+            return
+        delta = self.data_store.get_output_since(self._output_index)
+        self._output_index = self.data_store.get_output_count()
+        if not delta:
+            return
+        # Only follow the newest entry if the user has not scrolled up. Before the first layout the log has
+        # no size yet, so it always follows, and the scroll waits until the new lines have been laid out.
+        at_bottom = self.size.height == 0 or self.scroll_y >= self.max_scroll_y - 1
+        self.write(delta, scroll_end=False)
+        if at_bottom:
+            self.call_after_refresh(self.scroll_end, animate=False)
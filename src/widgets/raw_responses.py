@@ -1,12 +1,15 @@
 from textual.widgets import Static
 
-class RawResponses(Static):
+from widgets.change_tracker import ChangeTracker
+
+class RawResponses(ChangeTracker, Static):
     """
     A widget for displaying the raw JSON responses received from CoreMiner via HardHat.
 
     This widget retrieves JSON response data from a provided data store and displays it as raw text.
     Markup rendering is disabled to ensure the JSON is shown exactly as it is received. Once the content
-    is updated, the parent container is scrolled to the bottom to reveal the latest output.
+    is updated, the parent container is scrolled to the bottom to reveal the latest output, unless the user
+    has scrolled up.
     """
     
     def __init__(self, data_store):
@@ -34,7 +37,13 @@ class RawResponses(Static):
 
         This method retrieves the raw JSON responses from the data store using the `get_responses_coreminer`
         method, updates the display with this information, and scrolls the parent container to the bottom
-        without animation.
+        without animation if it was already scrolled to the bottom before.
         """
+        if not self._take_if_changed("responses_coreminer"):
+            return
+        # Only follow the newest entry if the user has not scrolled up
+        parent = self.parent
+        at_bottom = parent.scroll_y >= parent.max_scroll_y - 1
         self.update(self.data_store.get_responses_coreminer())
-        self.parent.scroll_end(animate=False)
+        if at_bottom:
+            parent.scroll_end(animate=False)
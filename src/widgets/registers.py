@@ -1,6 +1,8 @@
 from textual.widgets import Static
 
-class Registers(Static):
+from widgets.change_tracker import ChangeTracker
+
+class Registers(ChangeTracker, Static):
     """
     A widget that displays the current registers and their corresponding values of the debuggee.
     """
@@ -31,4 +33,6 @@ class Registers(Static):
         This method retrieves register data from the data store using the `get_registers` method
         and updates the widget's display with this information.
         """
+        if not self._take_if_changed("registers"):
+            return
         self.update(self.data_store.get_registers())
@@ -1,6 +1,8 @@
 from textual.widgets import Static
 
-class Stack(Static):
+from widgets.change_tracker import ChangeTracker
+
+class Stack(ChangeTracker, Static):
     """
     A widget that displays the current stack of the debuggee.
 
@@ -34,4 +36,6 @@ class Stack(Static):
         This method retrieves stack data from the data store using the `get_stack` method
         and updates the widget's display with the retrieved information.
         """
+        if not self._take_if_changed("stack"):
+            return
         self.update(self.data_store.get_stack())